@@ -4,18 +4,72 @@ MIT Candidate Dashboard API Server
 Serves Google Sheets data as JSON API for HTML frontend
 """
 
+import numpy as np
 import pandas as pd
 import hashlib
+import io
+import orjson
+import functools
 import random
-from flask import Flask, jsonify, send_file
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, request, send_from_directory
 from flask_cors import CORS
+from flask_caching import Cache
+from flask_compress import Compress
 import os
+import urllib.request
 
 # Create Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for HTML frontend
 
+# Compress larger JSON/HTML responses (brotli preferred, gzip fallback)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 512
+# index.html is a streamed file response; let Flask-Compress re-run the
+# conditional check against its ":br"/":gzip" ETag so revalidation gets a 304
+app.config['COMPRESS_STREAMING_ENDPOINT_CONDITIONAL'] = ['static', 'serve_dashboard']
+Compress(app)
+
+# Cache Google Sheets results so dashboard bursts share a single fetch.
+# Use Redis when REDIS_URL is set so all workers share the cache.
+CACHE_TIMEOUT = int(os.environ.get('CACHE_TIMEOUT', 60))
+if os.environ.get('REDIS_URL'):
+    app.config['CACHE_TYPE'] = 'RedisCache'
+    app.config['CACHE_REDIS_URL'] = os.environ['REDIS_URL']
+else:
+    app.config['CACHE_TYPE'] = 'SimpleCache'
+app.config['CACHE_DEFAULT_TIMEOUT'] = CACHE_TIMEOUT
+cache = Cache(app)
+
+# Background worker so independent Google Sheets fetches can overlap
+fetch_executor = ThreadPoolExecutor(max_workers=2)
+
 # ---- DATA LOADING FUNCTIONS (from original app.py) ----
+# Only the sheet columns the endpoints use are parsed
+MAIN_COLUMNS = ["MIT Name", "Training Site", "Location", "Week", "Level", "Status", "Salary"]
+JOBS_COLUMNS = ["Job Title", "Account", "City", "State", "VERT", "Salary"]
+
+def read_sheet(url, header, columns, required=()):
+    """Read the wanted columns of a published sheet CSV"""
+    with urllib.request.urlopen(url) as response:
+        raw = response.read()
+    
+    # Match header cells after stripping stray whitespace, then parse only those
+    names = pd.read_csv(io.BytesIO(raw), header=header, nrows=0).columns
+    present = [name for name in names if isinstance(name, str) and name.strip() in columns]
+    missing = [column for column in required if column not in {name.strip() for name in present}]
+    if missing:
+        raise KeyError(f"Missing required columns: {missing}")
+    
+    # The pyarrow engine ignores skiprows when a header row is given, so use header=
+    df = pd.read_csv(io.BytesIO(raw), header=header, engine="pyarrow", usecols=present)
+    df.columns = [c.strip() for c in df.columns]
+    return df.loc[:, ~df.columns.duplicated()]
+
+# Failed loads return a None ETag; don't cache those so the next request retries
+# (an empty but valid sheet is still cached)
+@cache.memoize(timeout=CACHE_TIMEOUT, response_filter=lambda rv: rv[-1] is not None)
 def load_data():
     """Load data from Google Sheets"""
     main_data_url = (
@@ -24,20 +78,28 @@ def load_data():
         "pub?gid=813046237&single=true&output=csv"
     )
     try:
-        df = pd.read_csv(main_data_url, skiprows=1)  # Skip only the first row with "Training info"
+        # Header is row 1 (skips the "Training info" row)
+        df = read_sheet(main_data_url, header=1, columns=MAIN_COLUMNS, required=["MIT Name"])
+        df = df.reindex(columns=MAIN_COLUMNS)  # optional columns missing from the sheet become blanks
         data_source = "Google Sheets"
     except Exception as e:
         print(f"⚠️ Google Sheets error: {e}")
-        return pd.DataFrame(), "Error"
+        return pd.DataFrame(), "Error", None
 
     df = df.dropna(how="all")
-    df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
     
     # Convert Status to lowercase like in original app.py
-    df["Status"] = df["Status"].astype(str).str.strip().str.lower()
+    # Categorical so the repeated ==/isin status filters compare integer codes
+    df["Status"] = df["Status"].astype(str).str.strip().str.lower().astype("category")
+    
+    # Numeric week for filtering; blanks and non-numeric values become NaN
+    df["_week_num"] = pd.to_numeric(df["Week"], errors="coerce")
+    df["_salary_num"] = parse_salary(df["Salary"])
     
-    return df, data_source
+    # Hash once per fetch; endpoints reuse it as their ETag
+    return df, data_source, data_etag(df)
 
+@cache.memoize(timeout=CACHE_TIMEOUT, response_filter=lambda rv: rv[-1] is not None)
 def load_jobs_data():
     """Load jobs data from Google Sheets"""
     # ✅ Correct Open Jobs Google Sheets URL from original app.py
@@ -47,58 +109,156 @@ def load_jobs_data():
         "pub?gid=116813539&single=true&output=csv"
     )
     try:
-        jobs_df = pd.read_csv(jobs_url, skiprows=5, header=0)
-        jobs_df = jobs_df.loc[:, ~jobs_df.columns.str.contains("^Unnamed")]
-        jobs_df = jobs_df.drop(columns=[c for c in ["JV Link", "JV ID"] if c in jobs_df.columns], errors="ignore")
+        jobs_df = read_sheet(jobs_url, header=5, columns=JOBS_COLUMNS)
         jobs_df = jobs_df.dropna(how="all").fillna("")
-        return jobs_df
+        return jobs_df, data_etag(jobs_df)
     except Exception as e:
         print(f"⚠️ Jobs data error: {e}")
-        return pd.DataFrame()
+        return pd.DataFrame(), None
 
-def parse_salary(salary_value):
-    """Parse salary from various formats to numeric value"""
-    if pd.isna(salary_value):
-        return 0
-    
-    # If already numeric, return it
-    if isinstance(salary_value, (int, float)):
-        return float(salary_value)
-    
-    # If string, clean it up
-    if isinstance(salary_value, str):
-        # Remove $, commas, and whitespace
-        cleaned = salary_value.replace('$', '').replace(',', '').strip()
-        try:
-            return float(cleaned)
-        except ValueError:
-            return 0
-    
-    return 0
+def parse_salary(salaries):
+    """Parse a salary column from various formats to numeric values"""
+    # Remove $, commas, and whitespace; blanks and unparseable values become 0
+    cleaned = salaries.astype(str).str.replace(r"[\$,\s]", "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0.0)
 
-def generate_mock_scores(candidate_name):
-    """Generate consistent mock scores based on candidate name"""
-    # Use hash of name to ensure consistent scores
+@functools.lru_cache(maxsize=4096)
+def _mock_scores(candidate_name):
+    # Use hash of name to ensure consistent scores; a private Random
+    # instance keeps the global generator untouched (thread-safe)
     hash_obj = hashlib.md5(candidate_name.encode())
     seed = int(hash_obj.hexdigest()[:8], 16)
-    random.seed(seed)
-
-    scores = {
-        'qbr_score': random.randint(65, 90),
-        'assessment_score': random.randint(70, 95),
-        'performance_score': random.randint(75, 95),
-        'confidence_score': random.randint(70, 90),
-        'skill_ranking': random.choice(['Top 10%', 'Top 15%', 'Top 20%', 'Top 25%'])
+    rng = random.Random(seed)
+
+    return {
+        'qbr_score': rng.randint(65, 90),
+        'assessment_score': rng.randint(70, 95),
+        'performance_score': rng.randint(75, 95),
+        'confidence_score': rng.randint(70, 90),
+        'skill_ranking': rng.choice(['Top 10%', 'Top 15%', 'Top 20%', 'Top 25%'])
+    }
+
+def generate_mock_scores(candidate_name):
+    """Generate consistent mock scores based on candidate name"""
+    return dict(_mock_scores(candidate_name))
+
+# Sheet column -> JSON field mappings for list endpoints
+CANDIDATE_FIELDS = {
+    'MIT Name': 'name',
+    'Training Site': 'training_site',
+    'Location': 'location',
+    'Week': 'week',
+    'Level': 'level',
+    '_salary_num': 'salary'
+}
+POSITION_FIELDS = {
+    'Job Title': 'job_title',
+    'Account': 'account',
+    'City': 'city',
+    'State': 'state',
+    'VERT': 'vertical',
+    'Salary': 'salary'
+}
+
+def to_records(frame, fields):
+    """Project frame columns to JSON records, using '—' for missing values"""
+    out = frame.reindex(columns=list(fields)).rename(columns=fields).astype(object)
+    return out.where(out.notna(), '—').to_dict(orient='records')
+
+def data_etag(frame):
+    """Build a strong ETag from the content of a DataFrame"""
+    return hashlib.md5(pd.util.hash_pandas_object(frame, index=True).values.tobytes()).hexdigest()
+
+# Process-local (etag, {name: row position}) for the latest data; the cached
+# frame is unpickled per request, so an index on it would be rebuilt every time
+_name_positions = (None, {})
+
+def candidate_position(df, etag, name):
+    """Return the row position of the first candidate with this name, or None"""
+    global _name_positions
+    cached_etag, positions = _name_positions
+    if cached_etag != etag:
+        positions = {}
+        for position, candidate_name in enumerate(df["MIT Name"]):
+            positions.setdefault(candidate_name, position)
+        _name_positions = (etag, positions)
+    return positions.get(name)
+
+def status_code_list(status, values):
+    """Return the categorical codes of the given Status values that are present"""
+    categories = status.cat.categories
+    return [categories.get_loc(value) for value in values if value in categories]
+
+def dumps_json(payload):
+    """Serialize payload to JSON bytes with orjson"""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+def ojson(payload, status=200):
+    """Build a JSON response; payload may already be serialized bytes"""
+    body = payload if isinstance(payload, bytes) else dumps_json(payload)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+def matching_client_etag(etag):
+    """Return the If-None-Match tag that matches etag, ignoring Flask-Compress's :br/:gzip suffix"""
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return etag
+    for tag in if_none_match.as_set(include_weak=True):
+        bare_tag = tag.rsplit(':', 1)[0] if tag.endswith((':br', ':gzip')) else tag
+        if bare_tag == etag:
+            return tag
+    return None
+
+def conditional_json(payload, etag):
+    """Return payload as JSON, or 304 Not Modified if the client's ETag matches"""
+    # Short-circuit before serializing/compressing an unchanged body, echoing
+    # the client's tag so a 304 carries the same validator as the 200 did
+    client_etag = matching_client_etag(etag)
+    if client_etag is not None:
+        response = app.response_class(status=304)
+        response.set_etag(client_etag)
+        return response
+    response = ojson(payload)
+    response.set_etag(etag)
+    return response
+
+# Keyed on the data ETag only, so each sheet fetch gets its own views
+@cache.memoize(timeout=CACHE_TIMEOUT, args_to_ignore=['df'])
+def build_views(etag, df):
+    """Pre-serialize the candidate list payloads for the frame with this ETag"""
+    # Ready for Placement: Week > 6 AND Status NOT IN ["position identified", "offer pending", "offer accepted"]
+    ready_candidates = df[
+        (df["_week_num"] > 6)
+        & (~df["Status"].isin(["position identified", "offer pending", "offer accepted"]))
+    ]
+    
+    # All candidates: non-identified (free agent, unassigned, training) plus offer accepted
+    non_identified = df[df["Status"].isin(["free agent discussing opportunity", "unassigned", "training"])]
+    offer_accepted = df[df["Status"] == "offer accepted"]
+    all_candidates_df = pd.concat([non_identified, offer_accepted])
+    
+    # In Training: Status == "training" AND Week <= 6
+    in_training = df[
+        df["Status"].eq("training") & (df["_week_num"] <= 6)
+    ]
+    
+    # Offer Pending: Status == "offer pending"
+    offer_pending = df[df["Status"] == "offer pending"]
+    
+    return {
+        'ready': dumps_json(to_records(ready_candidates, CANDIDATE_FIELDS)),
+        'all': dumps_json(to_records(all_candidates_df, {**CANDIDATE_FIELDS, 'Status': 'status'})),
+        'in_training': dumps_json(to_records(in_training, CANDIDATE_FIELDS)),
+        'offer_pending': dumps_json(to_records(offer_pending, CANDIDATE_FIELDS))
     }
-    random.seed()  # Reset random seed
-    return scores
 
 # ---- MAIN ROUTE ----
 
 @app.route('/')
 def serve_dashboard():
     """Serve the main dashboard HTML page"""
-    return send_file('index.html')
+    # Always revalidate; unchanged files get a 304 via ETag/Last-Modified
+    return send_from_directory(app.root_path, 'index.html', max_age=0, conditional=True)
 
 # ---- API ENDPOINTS ----
 
@@ -106,107 +266,89 @@ def serve_dashboard():
 def get_dashboard_data():
     """API endpoint for dashboard metrics"""
     try:
-        # Load data
-        df, data_source = load_data()
-        jobs_df = load_jobs_data()
+        # Load data (fetch both sheets concurrently; they're network-bound)
+        jobs_future = fetch_executor.submit(load_jobs_data)
+        df, data_source, etag = load_data()
+        jobs_df, jobs_etag = jobs_future.result()
         
         if df.empty:
-            return jsonify({'error': 'No data available'}), 500
+            return ojson({'error': 'No data available'}, 500)
         
         # Calculate metrics using CORRECT logic from original app.py
         
-        # Debug: Print unique status values to understand the data
-        print(f"DEBUG: Unique status values: {df['Status'].unique()}")
+        # Debug: Log status values (categories are precomputed; formatted only if enabled)
+        app.logger.debug("Unique status values: %s", df["Status"].cat.categories)
+        
+        # Count every status in a single pass over the column
+        status_counts = df["Status"].value_counts()
         
         # Offer Pending and Offer Accepted
-        offer_pending = len(df[df["Status"] == "offer pending"])
-        offer_accepted = len(df[df["Status"] == "offer accepted"])
+        offer_pending = int(status_counts.get("offer pending", 0))
+        offer_accepted = int(status_counts.get("offer accepted", 0))
         
         # Non-identified candidates (free agent, unassigned, training)
-        non_identified = len(df[df["Status"].isin(["free agent discussing opportunity", "unassigned", "training"])])
+        non_identified = sum(
+            int(status_counts.get(status, 0))
+            for status in ["free agent discussing opportunity", "unassigned", "training"]
+        )
         total_candidates = non_identified + offer_accepted
         
+        # Count the combined masks on raw arrays (no intermediate DataFrame slices)
+        status_codes = df["Status"].cat.codes.to_numpy()
+        week_num = df["_week_num"].to_numpy()
+        
         # Ready for Placement: Week > 6 AND Status NOT IN ["position identified", "offer pending", "offer accepted"]
-        ready_for_placement = df[
-            df["Week"].apply(lambda x: isinstance(x, (int, float)) and x > 6)
-            & (~df["Status"].isin(["position identified", "offer pending", "offer accepted"]))
-        ]
-        ready_count = len(ready_for_placement)
+        placed_codes = status_code_list(df["Status"], ["position identified", "offer pending", "offer accepted"])
+        ready_count = int(((week_num > 6) & ~np.isin(status_codes, placed_codes)).sum())
         
         # In Training: Status == "training" AND Week <= 6
-        in_training = len(
-            df[df["Status"].eq("training") & df["Week"].apply(lambda x: isinstance(x, (int, float)) and x <= 6)]
-        )
+        training_codes = status_code_list(df["Status"], ["training"])
+        in_training = int((np.isin(status_codes, training_codes) & (week_num <= 6)).sum())
         
         # Real open jobs count from Google Sheets
         open_jobs = len(jobs_df) if not jobs_df.empty else 0
         
-        return jsonify({
+        return conditional_json({
             'total_candidates': total_candidates,
             'ready_for_placement': ready_count,
             'in_training': in_training,
             'offer_pending': offer_pending,
             'open_jobs': open_jobs,
             'data_source': data_source
-        })
+        }, f"{etag}-{jobs_etag}")
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/api/candidates')
 def get_candidates():
     """API endpoint for candidate list"""
     try:
-        df, _ = load_data()
+        df, _, etag = load_data()
         
         if df.empty:
-            return jsonify([])
-        
-        # Get ready for placement candidates using CORRECT logic
-        ready_candidates = df[
-            df["Week"].apply(lambda x: isinstance(x, (int, float)) and x > 6)
-            & (~df["Status"].isin(["position identified", "offer pending", "offer accepted"]))
-        ]
-        
-        candidates = []
-        for _, row in ready_candidates.iterrows():
-            # Handle NaN values properly
-            week_value = row.get('Week', '—')
-            if pd.isna(week_value):
-                week_value = '—'
-            
-            salary_value = parse_salary(row.get('Salary', 0))
-            
-            candidates.append({
-                'name': row['MIT Name'],
-                'training_site': row.get('Training Site', '—'),
-                'location': row.get('Location', '—'),
-                'week': week_value,
-                'level': row.get('Level', '—'),
-                'salary': salary_value
-            })
-        
-        return jsonify(candidates)
+            return ojson([])
+        
+        return conditional_json(build_views(etag, df)['ready'], etag)
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/api/candidate/<name>')
 def get_candidate_profile(name):
     """API endpoint for individual candidate profile"""
     try:
-        df, _ = load_data()
+        df, _, etag = load_data()
         
         if df.empty:
-            return jsonify({'error': 'No data available'}), 500
-        
-        # Find candidate
-        candidate = df[df['MIT Name'] == name]
+            return ojson({'error': 'No data available'}, 500)
         
-        if candidate.empty:
-            return jsonify({'error': 'Candidate not found'}), 404
+        # Find candidate (first match if the name is duplicated)
+        position = candidate_position(df, etag, name)
+        if position is None:
+            return ojson({'error': 'Candidate not found'}, 404)
+        row = df.iloc[position]
         
-        row = candidate.iloc[0]
         mock_scores = generate_mock_scores(name)
         
         # Handle NaN values properly
@@ -214,9 +356,9 @@ def get_candidate_profile(name):
         if pd.isna(week_value):
             week_value = '—'
         
-        salary_value = parse_salary(row.get('Salary', 0))
+        salary_value = row['_salary_num']
         
-        return jsonify({
+        return conditional_json({
             'name': row['MIT Name'],
             'training_site': row.get('Training Site', '—'),
             'location': row.get('Location', '—'),
@@ -224,154 +366,84 @@ def get_candidate_profile(name):
             'level': row.get('Level', '—'),
             'salary': salary_value,
             'scores': mock_scores
-        })
+        }, etag)
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/api/all-candidates')
 def get_all_candidates():
     """API endpoint for all candidates"""
     try:
-        df, _ = load_data()
+        df, _, etag = load_data()
         
         if df.empty:
-            return jsonify([])
+            return ojson([])
         
-        # Offer Pending and Offer Accepted
-        offer_accepted = df[df["Status"] == "offer accepted"]
-        
-        # Non-identified candidates (free agent, unassigned, training)
-        non_identified = df[df["Status"].isin(["free agent discussing opportunity", "unassigned", "training"])]
-        
-        # Combine for all candidates
-        all_candidates_df = pd.concat([non_identified, offer_accepted])
-        
-        candidates = []
-        for _, row in all_candidates_df.iterrows():
-            # Handle NaN values properly
-            week_value = row.get('Week', '—')
-            if pd.isna(week_value):
-                week_value = '—'
-            
-            salary_value = parse_salary(row.get('Salary', 0))
-            
-            candidates.append({
-                'name': row['MIT Name'],
-                'training_site': row.get('Training Site', '—'),
-                'location': row.get('Location', '—'),
-                'week': week_value,
-                'level': row.get('Level', '—'),
-                'status': row.get('Status', '—'),
-                'salary': salary_value
-            })
-        
-        return jsonify(candidates)
+        return conditional_json(build_views(etag, df)['all'], etag)
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/api/in-training-candidates')
 def get_in_training_candidates():
     """API endpoint for in training candidates"""
     try:
-        df, _ = load_data()
+        df, _, etag = load_data()
         
         if df.empty:
-            return jsonify([])
+            return ojson([])
         
-        # In Training: Status == "training" AND Week <= 6
-        in_training = df[
-            df["Status"].eq("training") & df["Week"].apply(lambda x: isinstance(x, (int, float)) and x <= 6)
-        ]
-        
-        candidates = []
-        for _, row in in_training.iterrows():
-            # Handle NaN values properly
-            week_value = row.get('Week', '—')
-            if pd.isna(week_value):
-                week_value = '—'
-            
-            salary_value = parse_salary(row.get('Salary', 0))
-            
-            candidates.append({
-                'name': row['MIT Name'],
-                'training_site': row.get('Training Site', '—'),
-                'location': row.get('Location', '—'),
-                'week': week_value,
-                'level': row.get('Level', '—'),
-                'salary': salary_value
-            })
-        
-        return jsonify(candidates)
+        return conditional_json(build_views(etag, df)['in_training'], etag)
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/api/offer-pending-candidates')
 def get_offer_pending_candidates():
     """API endpoint for offer pending candidates"""
     try:
-        df, _ = load_data()
+        df, _, etag = load_data()
         
         if df.empty:
-            return jsonify([])
-        
-        # Offer Pending: Status == "offer pending"
-        offer_pending = df[df["Status"] == "offer pending"]
-        
-        candidates = []
-        for _, row in offer_pending.iterrows():
-            # Handle NaN values properly
-            week_value = row.get('Week', '—')
-            if pd.isna(week_value):
-                week_value = '—'
-            
-            salary_value = parse_salary(row.get('Salary', 0))
-            
-            candidates.append({
-                'name': row['MIT Name'],
-                'training_site': row.get('Training Site', '—'),
-                'location': row.get('Location', '—'),
-                'week': week_value,
-                'level': row.get('Level', '—'),
-                'salary': salary_value
-            })
-        
-        return jsonify(candidates)
+            return ojson([])
+        
+        return conditional_json(build_views(etag, df)['offer_pending'], etag)
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/api/open-positions')
 def get_open_positions():
     """API endpoint for open positions"""
     try:
-        jobs_df = load_jobs_data()
+        jobs_df, etag = load_jobs_data()
         
         if jobs_df.empty:
-            return jsonify([])
+            return ojson([])
         
-        positions = []
-        for _, row in jobs_df.iterrows():
-            positions.append({
-                'job_title': row.get('Job Title', '—'),
-                'account': row.get('Account', '—'),
-                'city': row.get('City', '—'),
-                'state': row.get('State', '—'),
-                'vertical': row.get('VERT', '—'),
-                'salary': row.get('Salary', '—')
-            })
+        positions = to_records(jobs_df, POSITION_FIELDS)
         
-        return jsonify(positions)
+        return conditional_json(positions, etag)
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
+
+@app.route('/api/refresh', methods=['POST'])
+def refresh_data():
+    """Clear cached Google Sheets data so the next request refetches it"""
+    # POST only, so links, crawlers and prefetches can't flush the cache.
+    # With the default SimpleCache this only clears the handling worker's
+    # cache; set REDIS_URL to clear it for every worker.
+    cache.delete_memoized(load_data)
+    cache.delete_memoized(build_views)
+    cache.delete_memoized(load_jobs_data)
+    return ojson({'status': 'ok', 'message': 'Data cache cleared'})
 
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'message': 'MIT Dashboard API is running'})
+    return ojson({'status': 'healthy', 'message': 'MIT Dashboard API is running'})
 
 # ---- MAIN ----
 if __name__ == "__main__":
@@ -384,6 +456,7 @@ if __name__ == "__main__":
     print("   - GET /api/in-training-candidates - In training candidates")
     print("   - GET /api/offer-pending-candidates - Offer pending candidates")
     print("   - GET /api/open-positions - Open job positions")
+    print("   - POST /api/refresh - Clear cached sheet data")
     print("   - GET /api/health - Health check")
     print("\nAPI Server running on: http://localhost:5000")
     print("Open your HTML file to use the dashboard!")